@@ -0,0 +1,64 @@
+"""
+日志工具模块
+各命令行脚本共用的日志配置
+"""
+
+import os
+import logging
+import logging.handlers
+
+# 所有工具共用的顶层日志器名称
+ROOT_LOGGER_NAME = 'autoseo'
+
+def setup_logging(name, log_file=None, verbose=False):
+    """
+    设置日志配置，同时输出到控制台和文件
+    
+    处理器挂在顶层日志器上，调用方自己的日志器和共享模块的日志器都是它的子日志器，
+    日志统一输出到同一组处理器
+    
+    Args:
+        name (str): 调用方的日志器名称，会放在顶层日志器之下
+        log_file (str): 日志文件路径，如果为None则不输出到文件
+        verbose (bool): 是否输出详细信息
+        
+    Returns:
+        logging.Logger: 调用方的日志器
+    """
+    # 配置顶层logger
+    root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    root_logger.setLevel(logging.INFO if not verbose else logging.DEBUG)
+    
+    # 清除已有的处理器，关闭后释放日志文件句柄
+    for handler in root_logger.handlers:
+        handler.close()
+    root_logger.handlers = []
+    
+    # 创建调用方的logger
+    logger = logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+    
+    # 设置日志格式
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    
+    # 控制台处理器
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+    root_logger.addHandler(console_handler)
+    
+    # 如果指定了日志文件，添加文件处理器
+    if log_file:
+        # 确保日志目录存在
+        os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+            
+        # 使用RotatingFileHandler，防止日志文件过大
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, 
+            maxBytes=10*1024*1024,  # 10MB
+            backupCount=5,
+            encoding='utf-8'
+        )
+        file_handler.setFormatter(formatter)
+        root_logger.addHandler(file_handler)
+        logger.info(f"日志将保存到文件: {log_file}")
+    
+    return logger
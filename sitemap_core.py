@@ -0,0 +1,756 @@
+"""
+AutoSEO公共模块
+包含sitemap解析以及百度/必应URL提交的共享实现，
+各命令行脚本共用同一个会话和预编译的XPath表达式
+"""
+
+import argparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httpx
+from lxml import etree
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import itertools
+import os
+import logging
+import urllib.parse
+import orjson
+import random
+import time
+from logging_utils import ROOT_LOGGER_NAME
+from url_utils import normalize_baidu_site, normalize_bing_site
+
+# 本模块的日志器，挂在顶层日志器之下
+_LOGGER_NAME = f"{ROOT_LOGGER_NAME}.{__name__}"
+
+# sitemap协议命名空间
+SITEMAP_NS = {'sm': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
+
+# 预编译的XPath表达式，避免每次解析都重新编译
+URL_LOC_XPATH = etree.XPath('/sm:urlset/sm:url/sm:loc', namespaces=SITEMAP_NS)
+IDX_LOC_XPATH = etree.XPath('/sm:sitemapindex/sm:sitemap/sm:loc', namespaces=SITEMAP_NS)
+
+# 能包含一个URL的最小sitemap长度，小于该长度的响应无需解析
+MIN_SITEMAP_SIZE = len(b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                       b'<url><loc>x</loc></url></urlset>')
+
+# 子sitemap并发请求数
+CHILD_CONCURRENCY = 8
+
+# 百度单次提交的URL数量
+BAIDU_BATCH_SIZE = 2000
+
+# 必应SubmitUrlbatch单次提交的URL数量上限
+BING_BATCH_SIZE = 500
+
+# IndexNow单次提交的URL数量上限
+INDEXNOW_BATCH_SIZE = 10000
+
+# 分批提交时的并发请求数
+SUBMIT_CONCURRENCY = 5
+
+# IndexNow提交接口
+INDEXNOW_API_URL = "https://api.indexnow.org/IndexNow"
+
+# 提交接口的请求头，所有批次共用
+_BAIDU_HEADERS = {'Content-Type': 'text/plain'}
+_JSON_HEADERS = {'Content-Type': 'application/json; charset=utf-8'}
+
+# 遇到限流或服务端临时错误时自动重试的状态码
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+def _create_session(pool_maxsize=8, backoff_factor=0.3, retry_post=False):
+    """
+    创建挂载了连接池和重试策略的会话
+    
+    Args:
+        pool_maxsize (int): 每个主机连接池的最大连接数
+        backoff_factor (float): 重试的指数退避系数
+        retry_post (bool): 是否对POST请求也进行重试，用于提交接口
+        
+    Returns:
+        requests.Session: 会话对象
+    """
+    allowed_methods = Retry.DEFAULT_ALLOWED_METHODS
+    if retry_post:
+        allowed_methods = allowed_methods | {'POST'}
+    # 重试耗尽后返回最后一次响应，由调用方按状态码记录错误
+    retry = Retry(total=3, backoff_factor=backoff_factor, status_forcelist=RETRY_STATUS_CODES,
+                  allowed_methods=allowed_methods, raise_on_status=False)
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# 复用连接的全局会话，避免每次请求都重新握手
+SESSION = _create_session(pool_maxsize=16)
+SESSION.headers['User-Agent'] = 'AutoSEO-sitemap/1.0'
+
+# 必应/IndexNow提交使用的会话，重试时复用已建立的TLS连接
+_BING_SESSION = _create_session(pool_maxsize=8, backoff_factor=0.8, retry_post=True)
+
+# HTTP/2客户端的retries只重试连接失败，子sitemap遇到限流或服务端错误时按以下参数自行重试
+CHILD_STATUS_RETRIES = 3
+CHILD_BACKOFF_FACTOR = 0.3
+
+# 子sitemap使用HTTP/2客户端，多个请求复用同一个连接；服务器不支持时自动回退到HTTP/1.1
+_H2_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(http2=True, retries=3,
+                                  limits=httpx.Limits(max_keepalive_connections=16)),
+    timeout=30,
+    headers={'User-Agent': 'AutoSEO-sitemap/1.0'},
+    # 与requests一致跟随重定向（如http→https、www与裸域互跳）
+    follow_redirects=True,
+)
+
+def _extract_locs(root):
+    """
+    通过XPath从已解析的sitemap根节点中提取所有<loc>
+    
+    Args:
+        root (etree._Element): sitemap的根节点
+        
+    Returns:
+        tuple: (页面URL列表, 子sitemap URL列表)
+    """
+    # 标准sitemap格式: <urlset><url><loc>，提取时顺带去重
+    urls = []
+    seen = set()
+    for loc in URL_LOC_XPATH(root):
+        url = loc.text.strip() if loc.text else ''
+        if url and url not in seen:
+            seen.add(url)
+            urls.append(url)
+    
+    # sitemap索引格式: <sitemapindex><sitemap><loc>
+    child_sitemaps = []
+    if not urls:
+        child_sitemaps = [loc.text.strip() for loc in IDX_LOC_XPATH(root)
+                          if loc.text and loc.text.strip()]
+    
+    return urls, child_sitemaps
+
+def parse_sitemap_locs(source):
+    """
+    使用lxml解析sitemap内容，通过XPath提取所有<loc>
+    
+    Args:
+        source (file): 可读取sitemap XML字节流的文件对象
+        
+    Returns:
+        tuple: (页面URL列表, 子sitemap URL列表)
+    """
+    return _extract_locs(etree.parse(source).getroot())
+
+def _is_trivial_response(response):
+    """
+    根据Content-Length判断响应是否小到不可能包含任何URL
+    
+    Args:
+        response (requests.Response): sitemap的响应
+        
+    Returns:
+        bool: 响应体过小时返回True
+    """
+    # 压缩后的长度与XML长度无关，无法据此判断
+    if response.headers.get('Content-Encoding', 'identity') != 'identity':
+        return False
+    content_length = response.headers.get('Content-Length')
+    return content_length is not None and content_length.isdigit() and int(content_length) < MIN_SITEMAP_SIZE
+
+def _parse_child_response(child_response, sitemap_child_url, verbose=False):
+    """
+    校验并流式解析子sitemap的响应
+    
+    Args:
+        child_response (httpx.Response): 以stream方式获取的响应
+        sitemap_child_url (str): 子sitemap的URL
+        verbose (bool): 是否输出详细信息
+        
+    Returns:
+        list: 子sitemap中的URL列表
+    """
+    child_response.raise_for_status()
+    if _is_trivial_response(child_response):
+        if verbose:
+            logging.getLogger(_LOGGER_NAME).info("子sitemap内容过小，跳过解析: %s", sitemap_child_url)
+        return []
+    # 边接收边喂给解析器
+    parser = etree.XMLParser()
+    for chunk in child_response.iter_bytes():
+        parser.feed(chunk)
+    child_urls, _ = _extract_locs(parser.close())
+    return child_urls
+
+def _fetch_and_parse_child(sitemap_child_url, verbose=False):
+    """
+    获取并解析单个子sitemap，遇到限流或服务端临时错误时按指数退避重试
+    
+    Args:
+        sitemap_child_url (str): 子sitemap的URL
+        verbose (bool): 是否输出详细信息
+        
+    Returns:
+        list: 子sitemap中的URL列表，出错时返回空列表
+    """
+    logger = logging.getLogger(_LOGGER_NAME)
+    if verbose:
+        logger.info("正在处理子sitemap: %s", sitemap_child_url)
+    try:
+        for attempt in range(CHILD_STATUS_RETRIES + 1):
+            with _H2_CLIENT.stream('GET', sitemap_child_url) as child_response:
+                if (child_response.status_code not in RETRY_STATUS_CODES
+                        or attempt == CHILD_STATUS_RETRIES):
+                    return _parse_child_response(child_response, sitemap_child_url, verbose)
+            # 先释放连接再退避，与SESSION的Retry保持一致
+            if verbose:
+                logger.info("子sitemap返回 %d，%.1f 秒后重试: %s", child_response.status_code,
+                            CHILD_BACKOFF_FACTOR * (2 ** attempt), sitemap_child_url)
+            time.sleep(CHILD_BACKOFF_FACTOR * (2 ** attempt))
+    except Exception as e:
+        # 失败的子sitemap会丢失其中的全部URL，不论是否verbose都要记录
+        logger.error("处理子sitemap出错: %s, 错误: %s", sitemap_child_url, e)
+        return []
+
+def get_sitemap_urls(sitemap_url, verbose=False):
+    """
+    获取sitemap中的所有URL
+    
+    Args:
+        sitemap_url (str): sitemap的URL
+        verbose (bool): 是否输出详细信息
+        
+    Returns:
+        list: URL列表
+    """
+    logger = logging.getLogger(_LOGGER_NAME)
+    urls = []
+    
+    try:
+        if verbose:
+            logger.info("正在获取sitemap: %s", sitemap_url)
+            
+        # 流式获取 sitemap.xml 内容，边接收边解析
+        with SESSION.get(sitemap_url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            if _is_trivial_response(response):
+                logger.info("sitemap内容过小，跳过解析")
+                return []
+            # 让urllib3自动处理gzip等传输编码
+            response.raw.decode_content = True
+            
+            # 解析 XML
+            urls, child_sitemaps = parse_sitemap_locs(response.raw)
+        
+        # 处理sitemap索引格式
+        if not urls:
+            if verbose:
+                logger.info("未找到URL，检查是否为sitemap索引...")
+                
+            # 使用线程池并发获取所有子sitemap，线程数即为限流
+            with ThreadPoolExecutor(max_workers=CHILD_CONCURRENCY) as executor:
+                results = list(executor.map(lambda url: _fetch_and_parse_child(url, verbose), child_sitemaps))
+            # 合并子sitemap结果，跨子sitemap去重并保持顺序
+            seen = set()
+            for child_urls in results:
+                for url in child_urls:
+                    if url not in seen:
+                        seen.add(url)
+                        urls.append(url)
+        
+        if verbose:
+            logger.info("从sitemap中提取到 %d 个URL", len(urls))
+            
+        return urls
+        
+    except Exception as e:
+        logger.error("解析sitemap时出错: %s", e)
+        return []
+
+def save_urls_to_file(urls, filename):
+    """
+    将URL列表保存到文件
+    
+    Args:
+        urls (list): URL列表
+        filename (str): 输出文件名
+    """
+    logger = logging.getLogger(_LOGGER_NAME)
+    try:
+        # 一次性编码为UTF-8字节后以二进制写入，绕过文本层的逐块编码
+        data = '\n'.join(urls).encode('utf-8')
+        with open(filename, 'wb') as f:
+            if data:
+                f.write(data)
+                f.write(b'\n')
+        logger.info("已保存 %d 个URL到 %s", len(urls), filename)
+        
+        # 输出前5个URL用于验证
+        if urls:
+            logger.info("前5个URL预览:")
+            for i, url in enumerate(urls[:5]):
+                logger.info("%d. %s", i + 1, url)
+                
+    except Exception as e:
+        logger.error("保存URL到文件时出错: %s", e)
+
+def positive_int(value):
+    """
+    argparse参数类型：只接受正整数
+    
+    Args:
+        value (str): 命令行传入的参数值
+        
+    Returns:
+        int: 解析后的正整数
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"必须为正整数: {value}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"必须为正整数: {value}")
+    return number
+
+def _chunks(seq, n):
+    """
+    将序列按固定大小切分
+    
+    Args:
+        seq (list): 待切分的序列
+        n (int): 每块的大小
+    """
+    for i in range(0, len(seq), n):
+        yield seq[i:i + n]
+
+def _reservoir_sample(lines, k):
+    """
+    单次遍历对URL进行蓄水池抽样，内存占用只与k相关
+    
+    Args:
+        lines (iterable): URL行，可以是文件对象
+        k (int): 抽样数量，0表示保留全部
+        
+    Returns:
+        tuple: (抽样后的URL列表, URL总数)
+    """
+    reservoir = []
+    total = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        total += 1
+        if k <= 0 or len(reservoir) < k:
+            reservoir.append(line)
+        else:
+            j = random.randrange(total)
+            if j < k:
+                reservoir[j] = line
+    return reservoir, total
+
+def _read_batches(urls_file, batch_size):
+    """
+    以二进制流式读取URL文件，去除空白行后每batch_size个URL组成一批
+    
+    Args:
+        urls_file (str): 包含URL的文件路径
+        batch_size (int): 每批的URL数量
+        
+    Returns:
+        generator: (URL数量, 请求体字节) 元组
+    """
+    with open(urls_file, 'rb', buffering=1024*1024) as f:
+        # 去掉首尾空白（包括\r\n）并跳过空行，只按真实URL计数和分批
+        urls = filter(None, (line.strip() for line in f))
+        while True:
+            chunk = list(itertools.islice(urls, batch_size))
+            if not chunk:
+                break
+            yield len(chunk), b'\n'.join(chunk)
+
+def _post_batches(session, api_url, batches, headers, concurrency, engine, success_codes=(200,)):
+    """
+    使用线程池并发提交多批数据
+    
+    Args:
+        session (requests.Session): 发送请求的会话
+        api_url (str): 提交接口地址
+        batches (list): (URL数量, 请求体) 元组列表
+        headers (dict): 请求头
+        concurrency (int): 并发请求数
+        engine (str): 搜索引擎名称，写在每条批次日志中，便于并发提交时区分来源
+        success_codes (tuple): 视为成功的HTTP状态码
+        
+    Returns:
+        tuple: (HTTP请求成功的URL数量, 提交失败的URL数量, 成功批次的响应列表)
+    """
+    logger = logging.getLogger(_LOGGER_NAME)
+    succeeded = 0
+    failed = 0
+    replies = []
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {executor.submit(session.post, api_url, data=body, headers=headers, timeout=30): count
+                   for count, body in batches}
+        for future in as_completed(futures):
+            count = futures[future]
+            try:
+                response = future.result()
+            except requests.exceptions.RequestException as e:
+                failed += count
+                logger.error("[%s] 网络请求错误: %s", engine, e)
+                continue
+            
+            if response.status_code in success_codes:
+                succeeded += count
+                replies.append(response)
+                # 响应体中包含配额、无效URL等信息，始终记录
+                logger.info("[%s] 批次提交成功 (%d 个URL): HTTP %d - %s",
+                            engine, count, response.status_code, response.text)
+            else:
+                failed += count
+                logger.error("[%s] 批次提交失败 (%d 个URL): HTTP %d - %s",
+                             engine, count, response.status_code, response.text)
+    
+    return succeeded, failed, replies
+
+def _parse_baidu_replies(replies):
+    """
+    汇总百度接口的JSON响应
+    
+    百度即使一个URL都没有接收也会返回HTTP 200，实际接收数量要看响应中的success字段
+    
+    Args:
+        replies (list): 成功批次的响应列表
+        
+    Returns:
+        tuple: (百度实际接收的URL数量, 当天剩余配额，无法解析时为None)
+    """
+    accepted = 0
+    remain = None
+    for response in replies:
+        try:
+            result = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            continue
+        if not isinstance(result, dict):
+            continue
+        accepted += result.get('success', 0)
+        # 各批次并发提交，剩余配额取最小值即最后一次扣减后的结果
+        if 'remain' in result:
+            remain = result['remain'] if remain is None else min(remain, result['remain'])
+    return accepted, remain
+
+class BaiduSubmitter:
+    """
+    百度URL提交器
+    
+    持有一个复用连接的会话，多次提交（如多个站点）时可以共享连接池，
+    避免每次提交都重新握手
+    """
+    
+    def __init__(self, pool_maxsize=8):
+        """
+        Args:
+            pool_maxsize (int): 连接池的最大连接数
+        """
+        self.session = _create_session(pool_maxsize=pool_maxsize, backoff_factor=0.8, retry_post=True)
+    
+    def submit(self, site_url, token, urls_file, verbose=False, random_count=0,
+               batch_size=BAIDU_BATCH_SIZE, concurrency=SUBMIT_CONCURRENCY):
+        """
+        提交URL到百度搜索引擎
+        
+        Args:
+            site_url (str): 网站URL
+            token (str): 百度站长平台的token
+            urls_file (str): 包含URL的文件路径
+            verbose (bool): 是否输出详细信息
+            random_count (int): 随机选择的URL数量，0表示不启用随机选择
+            batch_size (int): 每次请求提交的URL数量
+            concurrency (int): 分批提交时的并发请求数
+        """
+        logger = logging.getLogger(_LOGGER_NAME)
+        try:
+            # 验证和清理参数
+            if not site_url or not token or not urls_file:
+                raise ValueError("site_url、token和urls_file不能为空")
+            if batch_size <= 0 or concurrency <= 0:
+                raise ValueError("batch_size和concurrency必须为正整数")
+            
+            # 检查URL文件是否存在
+            if not os.path.exists(urls_file):
+                raise FileNotFoundError(f"URL文件不存在: {urls_file}")
+            
+            # 安全地构建API URL，避免日志泄露token
+            masked_token = token[:4] + "***" + token[-4:] if len(token) > 8 else "***"
+            
+            # 处理site_url，百度API需要不带协议的域名格式
+            site_url = normalize_baidu_site(site_url)
+                
+            # 构建API URL
+            params = {
+                'site': site_url,
+                'token': token
+            }
+            
+            # 使用urllib.parse构建查询字符串
+            query_string = urllib.parse.urlencode(params)
+            api_url = f"http://data.zz.baidu.com/urls?{query_string}"
+            
+            if verbose:
+                logger.info(f"正在提交URL到百度API (Token: {masked_token})")
+                logger.info(f"站点URL: {site_url}")
+                logger.info(f"API URL: {api_url.replace(token, masked_token)}")
+            
+            headers = _BAIDU_HEADERS
+            
+            # 未启用随机选择时，直接按行切分二进制文件，避免整体解码和重复编码
+            if random_count <= 0:
+                batches = list(_read_batches(urls_file, batch_size))
+                if not batches:
+                    logger.warning("URL文件为空，没有URL可以提交")
+                    return
+                
+                if verbose:
+                    url_count = sum(count for count, _ in batches)
+                    logger.info(f"提交的URL文件: {urls_file} ({url_count} 个URL)")
+                    logger.info("正在发送请求到百度API...")
+                    logger.info(f"请求URL: {api_url.replace(token, masked_token)}")
+                    logger.info(f"请求头: {headers}")
+            else:
+                # 以二进制流式读取URL文件并进行蓄水池抽样，文件本身即为UTF-8，无需解码再编码
+                with open(urls_file, 'rb', buffering=1024*1024) as f:
+                    urls_list, original_count = _reservoir_sample(f, random_count)
+                
+                if not original_count:
+                    logger.warning("URL文件为空，没有URL可以提交")
+                    return
+                
+                if original_count > random_count:
+                    logger.info(f"随机选择模式: 从 {original_count} 个URL中随机选择了 {random_count} 个")
+                else:
+                    logger.info(f"随机选择模式: URL总数({original_count})不超过{random_count}个，将全部提交")
+                
+                url_count = len(urls_list)
+                if verbose:
+                    logger.info(f"提交的URL数量: {url_count}")
+                    logger.info("正在发送请求到百度API...")
+                    logger.info(f"请求URL: {api_url.replace(token, masked_token)}")
+                    logger.info(f"请求头: {headers}")
+                    # 只预览前10条，避免大列表拖慢日志
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("请求体 (前10条, 共%d): %s", url_count,
+                                     [url.decode('utf-8') for url in urls_list[:10]])
+                    
+                batches = [(len(chunk), b'\n'.join(chunk)) for chunk in _chunks(urls_list, batch_size)]
+            
+            # 分批并发提交
+            succeeded, failed, replies = _post_batches(self.session, api_url, batches, headers, concurrency, '百度')
+            accepted, remain = _parse_baidu_replies(replies)
+            
+            if failed:
+                logger.error(f"提交URL到百度失败: 接收 {accepted} 个, 失败 {failed} 个, 剩余配额 {remain} (共 {len(batches)} 批)")
+            elif accepted < succeeded:
+                logger.warning(f"百度只接收了部分URL: 接收 {accepted} 个, 未接收 {succeeded - accepted} 个, 剩余配额 {remain} (共 {len(batches)} 批)")
+            else:
+                logger.info(f"成功提交URL到百度: 共 {accepted} 个, 剩余配额 {remain} (共 {len(batches)} 批)")
+                
+        except requests.exceptions.RequestException as e:
+            logger.error(f"网络请求错误: {str(e)}")
+        except Exception as e:
+            logger.error(f"提交URL到百度时出错: {str(e)}")
+
+# 模块级的默认提交器，命令行调用共用同一个连接池
+_SUBMITTER = BaiduSubmitter()
+
+def submit_to_baidu(site_url, token, urls_file, verbose=False, random_count=0,
+                    batch_size=BAIDU_BATCH_SIZE, concurrency=SUBMIT_CONCURRENCY):
+    """
+    提交URL到百度搜索引擎
+    
+    Args:
+        site_url (str): 网站URL
+        token (str): 百度站长平台的token
+        urls_file (str): 包含URL的文件路径
+        verbose (bool): 是否输出详细信息
+        random_count (int): 随机选择的URL数量，0表示不启用随机选择
+        batch_size (int): 每次请求提交的URL数量
+        concurrency (int): 分批提交时的并发请求数
+    """
+    _SUBMITTER.submit(site_url, token, urls_file, verbose, random_count, batch_size, concurrency)
+
+def submit_to_bing(site_url, api_key, urls_file, verbose=False, random_count=0,
+                   batch_size=BING_BATCH_SIZE, concurrency=SUBMIT_CONCURRENCY):
+    """
+    提交URL到必应搜索引擎
+    
+    Args:
+        site_url (str): 网站URL
+        api_key (str): 必应站长平台的API密钥
+        urls_file (str): 包含URL的文件路径
+        verbose (bool): 是否输出详细信息
+        random_count (int): 随机选择的URL数量，0表示不启用随机选择
+        batch_size (int): 每次请求提交的URL数量
+        concurrency (int): 分批提交时的并发请求数
+    """
+    logger = logging.getLogger(_LOGGER_NAME)
+    try:
+        # 验证和清理参数
+        if not site_url or not api_key or not urls_file:
+            raise ValueError("site_url、api_key和urls_file不能为空")
+        if batch_size <= 0 or concurrency <= 0:
+            raise ValueError("batch_size和concurrency必须为正整数")
+        
+        # 检查URL文件是否存在
+        if not os.path.exists(urls_file):
+            raise FileNotFoundError(f"URL文件不存在: {urls_file}")
+        
+        # 安全地处理API密钥，避免日志泄露
+        masked_key = api_key[:4] + "***" + api_key[-4:] if len(api_key) > 8 else "***"
+        
+        # 确保site_url格式正确
+        site_url, _, _ = normalize_bing_site(site_url)
+            
+        # 构建API URL
+        api_url = f"https://ssl.bing.com/webmaster/api.svc/json/SubmitUrlbatch?apikey={api_key}"
+        
+        headers = _JSON_HEADERS
+        
+        if verbose:
+            logger.info(f"正在提交URL到必应API (API Key: {masked_key})")
+            logger.info(f"站点URL: {site_url}")
+            logger.info(f"API URL: {api_url.replace(api_key, masked_key)}")
+        
+        # 流式读取URL文件，启用随机选择时同时进行蓄水池抽样
+        with open(urls_file, 'r', encoding='utf-8', buffering=1024*1024) as f:
+            urls, original_count = _reservoir_sample(f, random_count)
+        
+        if not urls:
+            logger.warning("URL文件为空，没有URL可以提交")
+            return
+        
+        if random_count > 0:
+            if original_count > random_count:
+                logger.info(f"随机选择模式: 从 {original_count} 个URL中随机选择了 {random_count} 个")
+            else:
+                logger.info(f"随机选择模式: URL总数({original_count})不超过{random_count}个，将全部提交")
+        
+        # 构建请求数据
+        request_data = {
+            "siteUrl": site_url
+        }
+        
+        if verbose:
+            logger.info(f"提交的URL数量: {len(urls)}")
+            logger.info("正在发送请求到必应API...")
+            logger.debug("请求体 (前10条, 共%d): %s", len(urls), dict(request_data, urlList=urls[:10]))
+            
+        # 按接口上限分批，并发发送POST请求
+        batches = [(len(chunk), orjson.dumps(dict(request_data, urlList=chunk)))
+                   for chunk in _chunks(urls, batch_size)]
+        succeeded, failed, _ = _post_batches(_BING_SESSION, api_url, batches, headers, concurrency, '必应')
+        
+        if failed:
+            logger.error(f"提交URL到必应失败: 成功 {succeeded} 个, 失败 {failed} 个 (共 {len(batches)} 批)")
+        else:
+            logger.info(f"成功提交URL到必应: 共 {succeeded} 个 (共 {len(batches)} 批)")
+            
+    except requests.exceptions.RequestException as e:
+        logger.error(f"网络请求错误: {str(e)}")
+    except Exception as e:
+        logger.error(f"提交URL到必应时出错: {str(e)}")
+
+def submit_to_indexnow(site_url, api_key, urls_file, verbose=False, random_count=0,
+                       batch_size=INDEXNOW_BATCH_SIZE, concurrency=SUBMIT_CONCURRENCY):
+    """
+    通过IndexNow API提交URL
+    
+    Args:
+        site_url (str): 网站URL
+        api_key (str): IndexNow的API密钥
+        urls_file (str): 包含URL的文件路径
+        verbose (bool): 是否输出详细信息
+        random_count (int): 随机选择的URL数量，0表示不启用随机选择
+        batch_size (int): 每次请求提交的URL数量
+        concurrency (int): 分批提交时的并发请求数
+    """
+    logger = logging.getLogger(_LOGGER_NAME)
+    try:
+        # 验证和清理参数
+        if not site_url or not api_key or not urls_file:
+            raise ValueError("site_url、api_key和urls_file不能为空")
+        if batch_size <= 0 or concurrency <= 0:
+            raise ValueError("batch_size和concurrency必须为正整数")
+        
+        # 检查URL文件是否存在
+        if not os.path.exists(urls_file):
+            raise FileNotFoundError(f"URL文件不存在: {urls_file}")
+        
+        # 安全地处理API密钥，避免日志泄露
+        masked_key = api_key[:4] + "***" + api_key[-4:] if len(api_key) > 8 else "***"
+        
+        # 确保site_url格式正确
+        site_url, host, key_base_url = normalize_bing_site(site_url)
+        
+        # IndexNow API URL
+        api_url = INDEXNOW_API_URL
+        headers = _JSON_HEADERS
+        
+        if verbose:
+            logger.info(f"正在通过IndexNow API提交URL (API Key: {masked_key})")
+            logger.info(f"站点URL: {site_url}")
+            logger.info(f"Host: {host}")
+            logger.info(f"API URL: {api_url}")
+        
+        # 流式读取URL文件，启用随机选择时同时进行蓄水池抽样
+        with open(urls_file, 'r', encoding='utf-8', buffering=1024*1024) as f:
+            urls, original_count = _reservoir_sample(f, random_count)
+        
+        if not urls:
+            logger.warning("URL文件为空，没有URL可以提交")
+            return
+        
+        if random_count > 0:
+            if original_count > random_count:
+                logger.info(f"随机选择模式: 从 {original_count} 个URL中随机选择了 {random_count} 个")
+            else:
+                logger.info(f"随机选择模式: URL总数({original_count})不超过{random_count}个，将全部提交")
+        
+        # 构建IndexNow请求数据
+        request_data = {
+            "host": host,
+            "key": api_key,
+            "keyLocation": f"{key_base_url}/{api_key}.txt"
+        }
+        
+        if verbose:
+            logger.info(f"提交的URL数量: {len(urls)}")
+            logger.info("正在发送请求到IndexNow API...")
+            logger.info(f"请求URL: {api_url}")
+            logger.info(f"请求头: {headers}")
+            # 只预览前10条，避免大列表拖慢日志
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("请求体 (前10条, 共%d): %s", len(urls),
+                             orjson.dumps(dict(request_data, urlList=urls[:10])).decode('utf-8').replace(api_key, masked_key))
+            
+        # 按接口上限分批，并发发送POST请求
+        batches = [(len(chunk), orjson.dumps(dict(request_data, urlList=chunk)))
+                   for chunk in _chunks(urls, batch_size)]
+        # IndexNow返回200或202表示成功
+        succeeded, failed, _ = _post_batches(_BING_SESSION, api_url, batches, headers, concurrency,
+                                             'IndexNow', success_codes=(200, 202))
+        
+        if failed:
+            logger.error(f"通过IndexNow提交URL失败: 成功 {succeeded} 个, 失败 {failed} 个 (共 {len(batches)} 批)")
+        else:
+            logger.info(f"成功通过IndexNow提交URL: 共 {succeeded} 个 (共 {len(batches)} 批)")
+            
+    except requests.exceptions.RequestException as e:
+        logger.error(f"网络请求错误: {str(e)}")
+    except Exception as e:
+        logger.error(f"通过IndexNow提交URL时出错: {str(e)}")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+多搜索引擎并发提交工具
+在同一个事件循环中同时将URL列表提交到百度和必应，总耗时取决于最慢的接口
+"""
+
+import argparse
+import asyncio
+import sys
+import os
+from logging_utils import setup_logging
+from sitemap_core import submit_to_baidu, submit_to_bing, submit_to_indexnow
+
+async def submit_all(args):
+    """
+    并发提交URL到所有已配置的搜索引擎
+
+    Args:
+        args (argparse.Namespace): 命令行参数
+    """
+    tasks = []
+
+    # 提交函数基于共享连接池的同步会话，放到线程中执行以便并发等待
+    if args.token:
+        tasks.append(asyncio.to_thread(
+            submit_to_baidu, args.site, args.token, args.urls_file, args.verbose, args.baidu_random))
+
+    if args.api_key:
+        submit_bing = submit_to_bing if args.no_indexnow else submit_to_indexnow
+        tasks.append(asyncio.to_thread(
+            submit_bing, args.site, args.api_key, args.urls_file, args.verbose, args.bing_random))
+
+    await asyncio.gather(*tasks)
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description='并发提交URL到百度和必应搜索引擎')
+    parser.add_argument('--site',
+                        default=os.environ.get('SITE_URL', 'https://www.bonan.online'),
+                        help='网站URL')
+    parser.add_argument('--token',
+                        default=os.environ.get('BAIDU_TOKEN', ''),
+                        help='百度站长平台的token，为空则跳过百度')
+    parser.add_argument('--api-key',
+                        default=os.environ.get('BING_API_KEY', ''),
+                        help='必应的API密钥，为空则跳过必应')
+    parser.add_argument('--urls-file', default='urls.txt',
+                        help='包含URL的文件路径')
+    parser.add_argument('--verbose', action='store_true',
+                        help='输出详细信息')
+    parser.add_argument('--baidu-random', type=int, default=10, metavar='N',
+                        help='随机选择N个URL提交到百度（默认: 10）')
+    parser.add_argument('--bing-random', type=int, default=100, metavar='N',
+                        help='随机选择N个URL提交到必应（默认: 100）')
+    parser.add_argument('--no-indexnow', action='store_true',
+                        help='必应使用传统Bing Webmaster API提交')
+    parser.add_argument('--log-file', default='submit_async.log',
+                        help='日志文件路径 (默认: submit_async.log)')
+
+    args = parser.parse_args()
+
+    # 获取日志文件路径
+    log_file = args.log_file
+
+    # 初始化日志系统
+    logger = setup_logging('submit_async', log_file, args.verbose)
+
+    logger.info("=" * 50)
+    logger.info("多搜索引擎并发提交工具启动")
+    logger.info(f"日志文件: {log_file}")
+    logger.info("=" * 50)
+
+    # 至少需要配置一个搜索引擎
+    if not args.token and not args.api_key:
+        logger.error("请至少通过--token/BAIDU_TOKEN或--api-key/BING_API_KEY提供一个搜索引擎的凭据")
+        sys.exit(1)
+
+    asyncio.run(submit_all(args))
+
+    logger.info("=" * 50)
+    logger.info("程序执行完成")
+    logger.info("=" * 50)
+
+if __name__ == "__main__":
+    main()
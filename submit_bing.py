@@ -5,242 +5,12 @@
 支持传统Bing Webmaster API和IndexNow API
 """
 
-import requests
 import argparse
 import sys
 import os
-import logging
-import logging.handlers
-import json
-import random
-from datetime import datetime
-from urllib.parse import urlparse
-
-def setup_logging(log_file=None, verbose=False):
-    """
-    设置日志配置，同时输出到控制台和文件
-    
-    Args:
-        log_file (str): 日志文件路径，如果为None则不输出到文件
-        verbose (bool): 是否输出详细信息
-    """
-    # 创建logger
-    logger = logging.getLogger(__name__)
-    logger.setLevel(logging.INFO if not verbose else logging.DEBUG)
-    
-    # 清除已有的处理器
-    logger.handlers = []
-    
-    # 设置日志格式
-    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-    
-    # 控制台处理器
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # 如果指定了日志文件，添加文件处理器
-    if log_file:
-        # 确保日志目录存在
-        log_dir = os.path.dirname(os.path.abspath(log_file))
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-            
-        # 使用RotatingFileHandler，防止日志文件过大
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file, 
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5,
-            encoding='utf-8'
-        )
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        logger.info(f"日志将保存到文件: {log_file}")
-    
-    return logger
-
-def submit_to_bing(site_url, api_key, urls_file, verbose=False, random_count=0):
-    """
-    提交URL到必应搜索引擎
-    
-    Args:
-        site_url (str): 网站URL
-        api_key (str): 必应站长平台的API密钥
-        urls_file (str): 包含URL的文件路径
-        verbose (bool): 是否输出详细信息
-        random_count (int): 随机选择的URL数量，0表示不启用随机选择
-    """
-    logger = logging.getLogger(__name__)
-    try:
-        # 验证和清理参数
-        if not site_url or not api_key or not urls_file:
-            raise ValueError("site_url、api_key和urls_file不能为空")
-        
-        # 检查URL文件是否存在
-        if not os.path.exists(urls_file):
-            raise FileNotFoundError(f"URL文件不存在: {urls_file}")
-        
-        # 安全地处理API密钥，避免日志泄露
-        masked_key = api_key[:4] + "***" + api_key[-4:] if len(api_key) > 8 else "***"
-        
-        # 确保site_url格式正确
-        site_url = site_url.strip()
-        if not site_url.startswith(('http://', 'https://')):
-            site_url = 'https://' + site_url
-            
-        # 构建API URL
-        api_url = f"https://ssl.bing.com/webmaster/api.svc/json/SubmitUrlbatch?apikey={api_key}"
-        
-        if verbose:
-            logger.info(f"正在提交URL到必应API (API Key: {masked_key})")
-            logger.info(f"站点URL: {site_url}")
-            logger.info(f"API URL: {api_url.replace(api_key, masked_key)}")
-        
-        # 读取URL文件
-        with open(urls_file, 'r', encoding='utf-8') as f:
-            urls = [line.strip() for line in f if line.strip()]
-        
-        if not urls:
-            logger.warning("URL文件为空，没有URL可以提交")
-            return
-        
-        # 如果启用随机选择，从URL列表中随机选择指定数量
-        if random_count > 0:
-            original_count = len(urls)
-            if original_count > random_count:
-                urls = random.sample(urls, random_count)
-                logger.info(f"随机选择模式: 从 {original_count} 个URL中随机选择了 {random_count} 个")
-            else:
-                logger.info(f"随机选择模式: URL总数({original_count})不超过{random_count}个，将全部提交")
-        
-        # 构建请求数据
-        request_data = {
-            "siteUrl": site_url,
-            "urlList": urls
-        }
-        
-        headers = {
-            'Content-Type': 'application/json; charset=utf-8'
-        }
-        
-        if verbose:
-            logger.info(f"提交的URL数量: {len(urls)}")
-            logger.info("正在发送请求到必应API...")
-            if verbose:
-                logger.debug(f"请求体: {json.dumps(request_data, indent=2, ensure_ascii=False)}")
-            
-        # 发送POST请求
-        response = requests.post(api_url, 
-                               data=json.dumps(request_data, ensure_ascii=False).encode('utf-8'), 
-                               headers=headers, 
-                               timeout=30)
-        
-        if response.status_code == 200:
-            logger.info(f"成功提交URL到必应: {response.text}")
-        else:
-            logger.error(f"提交URL到必应失败: HTTP {response.status_code} - {response.text}")
-            
-    except requests.exceptions.RequestException as e:
-        logger.error(f"网络请求错误: {str(e)}")
-    except Exception as e:
-        logger.error(f"提交URL到必应时出错: {str(e)}")
-
-def submit_to_indexnow(site_url, api_key, urls_file, verbose=False, random_count=0):
-    """
-    通过IndexNow API提交URL
-    
-    Args:
-        site_url (str): 网站URL
-        api_key (str): IndexNow的API密钥
-        urls_file (str): 包含URL的文件路径
-        verbose (bool): 是否输出详细信息
-        random_count (int): 随机选择的URL数量，0表示不启用随机选择
-    """
-    logger = logging.getLogger(__name__)
-    try:
-        # 验证和清理参数
-        if not site_url or not api_key or not urls_file:
-            raise ValueError("site_url、api_key和urls_file不能为空")
-        
-        # 检查URL文件是否存在
-        if not os.path.exists(urls_file):
-            raise FileNotFoundError(f"URL文件不存在: {urls_file}")
-        
-        # 安全地处理API密钥，避免日志泄露
-        masked_key = api_key[:4] + "***" + api_key[-4:] if len(api_key) > 8 else "***"
-        
-        # 确保site_url格式正确
-        site_url = site_url.strip()
-        if not site_url.startswith(('http://', 'https://')):
-            site_url = 'https://' + site_url
-        
-        # 解析host
-        parsed_url = urlparse(site_url)
-        host = parsed_url.netloc
-        
-        # IndexNow API URL
-        api_url = "https://api.indexnow.org/IndexNow"
-        
-        if verbose:
-            logger.info(f"正在通过IndexNow API提交URL (API Key: {masked_key})")
-            logger.info(f"站点URL: {site_url}")
-            logger.info(f"Host: {host}")
-            logger.info(f"API URL: {api_url}")
-        
-        # 读取URL文件
-        with open(urls_file, 'r', encoding='utf-8') as f:
-            urls = [line.strip() for line in f if line.strip()]
-        
-        if not urls:
-            logger.warning("URL文件为空，没有URL可以提交")
-            return
-        
-        # 如果启用随机选择，从URL列表中随机选择指定数量
-        if random_count > 0:
-            original_count = len(urls)
-            if original_count > random_count:
-                urls = random.sample(urls, random_count)
-                logger.info(f"随机选择模式: 从 {original_count} 个URL中随机选择了 {random_count} 个")
-            else:
-                logger.info(f"随机选择模式: URL总数({original_count})不超过{random_count}个，将全部提交")
-        
-        # 构建IndexNow请求数据
-        request_data = {
-            "host": host,
-            "key": api_key,
-            "keyLocation": f"{site_url.rstrip('/')}/{api_key}.txt",
-            "urlList": urls
-        }
-        
-        headers = {
-            'Content-Type': 'application/json; charset=utf-8'
-        }
-        
-        if verbose:
-            logger.info(f"提交的URL数量: {len(urls)}")
-            logger.info("正在发送请求到IndexNow API...")
-            logger.info(f"请求URL: {api_url}")
-            logger.info(f"请求头: {headers}")
-            logger.info(f"请求体: {json.dumps(request_data, indent=2, ensure_ascii=False).replace(api_key, masked_key)}")
-            
-        # 发送POST请求
-        response = requests.post(api_url, 
-                               data=json.dumps(request_data, ensure_ascii=False).encode('utf-8'), 
-                               headers=headers, 
-                               timeout=30)
-        
-        # IndexNow返回200或202表示成功
-        if response.status_code in [200, 202]:
-            logger.info(f"成功通过IndexNow提交URL: HTTP {response.status_code}")
-            if response.text:
-                logger.info(f"响应: {response.text}")
-        else:
-            logger.error(f"通过IndexNow提交URL失败: HTTP {response.status_code} - {response.text}")
-            
-    except requests.exceptions.RequestException as e:
-        logger.error(f"网络请求错误: {str(e)}")
-    except Exception as e:
-        logger.error(f"通过IndexNow提交URL时出错: {str(e)}")
+from logging_utils import setup_logging
+from sitemap_core import (submit_to_bing, submit_to_indexnow, positive_int,
+                          BING_BATCH_SIZE, INDEXNOW_BATCH_SIZE, SUBMIT_CONCURRENCY)
 
 def main():
     """主函数"""
@@ -261,6 +31,10 @@ def main():
                         help='使用IndexNow API提交（默认启用，需要在网站根目录放置key文件）')
     parser.add_argument('--no-indexnow', action='store_true',
                         help='使用传统Bing Webmaster API提交')
+    parser.add_argument('--batch-size', type=positive_int, default=None, metavar='N',
+                        help=f'每次请求提交的URL数量（默认: IndexNow {INDEXNOW_BATCH_SIZE}，传统API {BING_BATCH_SIZE}）')
+    parser.add_argument('--concurrency', type=positive_int, default=SUBMIT_CONCURRENCY, metavar='N',
+                        help=f'分批提交时的并发请求数（默认: {SUBMIT_CONCURRENCY}）')
     parser.add_argument('--log-file', default='submit_bing.log',
                         help='日志文件路径 (默认: submit_bing.log)')
     
@@ -273,7 +47,7 @@ def main():
     log_file = args.log_file
     
     # 初始化日志系统
-    logger = setup_logging(log_file, args.verbose)
+    logger = setup_logging('submit_bing', log_file, args.verbose)
     
     logger.info("=" * 50)
     logger.info("必应URL提交工具启动")
@@ -286,11 +60,15 @@ def main():
         logger.error("提交到必应需要API密钥，请通过--api-key参数或BING_API_KEY环境变量提供")
         sys.exit(1)
     
-    # 根据模式选择提交方式
+    # 根据模式选择提交方式，未指定批大小时使用各接口自己的上限
     if use_indexnow:
-        submit_to_indexnow(args.site, args.api_key, args.urls_file, args.verbose, args.random)
+        submit_to_indexnow(args.site, args.api_key, args.urls_file, args.verbose, args.random,
+                           args.batch_size if args.batch_size is not None else INDEXNOW_BATCH_SIZE,
+                           args.concurrency)
     else:
-        submit_to_bing(args.site, args.api_key, args.urls_file, args.verbose, args.random)
+        submit_to_bing(args.site, args.api_key, args.urls_file, args.verbose, args.random,
+                       args.batch_size if args.batch_size is not None else BING_BATCH_SIZE,
+                       args.concurrency)
     
     logger.info("=" * 50)
     logger.info("程序执行完成")
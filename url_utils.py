@@ -0,0 +1,68 @@
+"""
+URL工具模块
+各搜索引擎提交时共用的站点URL规范化
+"""
+
+import functools
+import urllib.parse
+
+def _split_site_url(raw, default_scheme):
+    """
+    解析站点URL，缺少协议头时使用默认协议
+
+    Args:
+        raw (str): 原始站点URL
+        default_scheme (str): 缺少协议头时使用的协议
+
+    Returns:
+        urllib.parse.SplitResult: 解析结果
+    """
+    raw = raw.strip()
+    return urllib.parse.urlsplit(raw if '://' in raw else '//' + raw.lstrip('/'), scheme=default_scheme)
+
+def _host_with_port(parsed_url):
+    """
+    取出不含用户信息的主机名和端口
+
+    Args:
+        parsed_url (urllib.parse.SplitResult): 站点URL的解析结果
+
+    Returns:
+        str: 主机名（含端口），IPv6地址带方括号
+    """
+    host = parsed_url.hostname or ''
+    if ':' in host:
+        host = f"[{host}]"
+    if parsed_url.port is not None:
+        host = f"{host}:{parsed_url.port}"
+    return host
+
+@functools.lru_cache(maxsize=128)
+def normalize_baidu_site(raw):
+    """
+    将站点URL规范化为百度API需要的不带协议的域名格式
+
+    Args:
+        raw (str): 原始站点URL
+
+    Returns:
+        str: 域名（含端口），不含协议头、用户信息和路径
+    """
+    return _host_with_port(_split_site_url(raw, 'http'))
+
+@functools.lru_cache(maxsize=128)
+def normalize_bing_site(raw):
+    """
+    将站点URL规范化为必应/IndexNow需要的带协议格式
+
+    Args:
+        raw (str): 原始站点URL
+
+    Returns:
+        tuple: (scheme://host 形式的站点URL, host, 保留路径且去掉末尾'/'的站点地址)，
+            均不含用户信息；最后一项用于拼接IndexNow的keyLocation
+    """
+    parsed_url = _split_site_url(raw, 'https')
+    host = _host_with_port(parsed_url)
+    site_url = f"{parsed_url.scheme}://{host}"
+    return site_url, host, site_url + parsed_url.path.rstrip('/')